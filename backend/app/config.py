@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 LOCAL_ENV_PATH = PROJECT_ROOT / ".env"
 
 
-def _read_env_file_value(path: Path, key: str) -> str:
+@lru_cache(maxsize=1)
+def _read_env_file(path: Path) -> dict[str, str]:
     if not path.exists():
-        return ""
+        return {}
 
+    values: dict[str, str] = {}
     try:
         for raw_line in path.read_text(encoding="utf-8").splitlines():
             line = raw_line.strip()
@@ -19,22 +22,24 @@ def _read_env_file_value(path: Path, key: str) -> str:
                 continue
 
             current_key, current_value = line.split("=", 1)
-            if current_key.strip() != key:
-                continue
-
-            return current_value.strip().strip('"').strip("'")
+            values.setdefault(current_key.strip(), current_value.strip().strip('"').strip("'"))
     except OSError:
-        return ""
+        return {}
 
-    return ""
+    return values
+
+
+def _read_env_file_value(path: Path, key: str) -> str:
+    return _read_env_file(path).get(key, "")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     gemini_api_key: str
     gemini_model: str
     llm_request_timeout_sec: int
     llm_mode: str
+    llm_max_concurrency: int = 16
 
 
 def _resolve_gemini_api_key() -> str:
@@ -69,6 +74,7 @@ def _resolve_llm_mode() -> str:
     return "live"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     model = os.getenv("GEMINI_MODEL", "gemini-3.5-flash").strip() or "gemini-3.5-flash"
     timeout_sec = _resolve_int("LLM_REQUEST_TIMEOUT_SEC", 30)
@@ -78,6 +84,7 @@ def get_settings() -> Settings:
         gemini_model=model,
         llm_request_timeout_sec=timeout_sec,
         llm_mode=_resolve_llm_mode(),
+        llm_max_concurrency=_resolve_int("LLM_MAX_CONCURRENCY", 16),
     )
 
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from enum import Enum
 
 
@@ -29,15 +28,16 @@ CRISIS_KEYWORDS = [
     "해치고 싶",
 ]
 
-MEDICAL_RISK_PATTERNS = [
-    re.compile(r"진단"),
-    re.compile(r"처방"),
-    re.compile(r"병명"),
-    re.compile(r"입원"),
-    re.compile(r"약(?:물)?\s*(복용|드시|먹)"),
-    re.compile(r"(우울증|불안장애|조현병|양극성)"),
-    re.compile(r"치료\s*(가|를|받)"),
-]
+# Spelled-out equivalent of Python's Unicode `\s`: RE2's `\s` is ASCII-only and would miss
+# NBSP/ideographic spaces. Plain (non-raw) string so both engines see literal characters.
+UNICODE_SPACE_CLASS = "[\t-\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]"
+
+MEDICAL_RISK_PATTERN = (
+    r"진단|처방|병명|입원"
+    rf"|약(?:물)?{UNICODE_SPACE_CLASS}*(?:복용|드시|먹)"
+    r"|우울증|불안장애|조현병|양극성"
+    rf"|치료{UNICODE_SPACE_CLASS}*(?:가|를|받)"
+)
 
 FALLBACK_COMFORT: dict[Emotion, list[str]] = {
     Emotion.calm: [
@@ -1,13 +1,43 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
 from functools import lru_cache
-
-from google import genai
-from google.genai import types
+from time import monotonic
+from typing import TYPE_CHECKING
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    from google import genai
+
+# Reuse warm TLS connections to the Gemini endpoint across requests.
+LLM_HTTP_LIMITS: dict[str, int | float] = {
+    "max_keepalive_connections": 16,
+    "max_connections": 32,
+    "keepalive_expiry": 60.0,
+}
+
+# Per-attempt timeouts sit just above typical latency so stragglers are retried
+# instead of pinning a worker. LLM_REQUEST_TIMEOUT_SEC bounds the whole call,
+# retries and backoff included; no new attempt starts once it has elapsed.
+COMFORT_TIMEOUT_SEC = 8.0
+COMFORT_RETRIES = 2
+INSIGHT_TIMEOUT_SEC = 15.0
+INSIGHT_RETRIES = 1
+LLM_RETRY_BACKOFF_SEC = 0.25
+
+# Comfort replies keyed by (emotion label, PII-masked content); raw text never reaches this cache.
+COMFORT_CACHE_MAXSIZE = 2048
+COMFORT_CACHE_TTL_SEC = 3600.0
+_comfort_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+
+# Caps in-flight Gemini calls across concurrent requests to stay under the provider QPM limits.
+# One semaphore per event loop: an asyncio.Semaphore binds to the first loop that waits on it.
+_llm_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
 
 class LLMNotConfiguredError(RuntimeError):
     pass
@@ -22,7 +52,24 @@ def _client() -> genai.Client:
     if not settings.gemini_api_key:
         raise LLMNotConfiguredError("GEMINI_API_KEY가 설정되지 않았습니다.")
 
-    return genai.Client(api_key=settings.gemini_api_key)
+    # google.genai (and httpx under it) is heavy; stub mode never reaches here, so import lazily.
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    # Pass limits rather than a prebuilt transport so genai keeps its SSL_CERT_FILE/SSL_CERT_DIR `verify` context.
+    return genai.Client(
+        api_key=settings.gemini_api_key,
+        http_options=types.HttpOptions(async_client_args={"limits": httpx.Limits(**LLM_HTTP_LIMITS)}),
+    )
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(settings.llm_max_concurrency)
+    return semaphore
 
 
 async def _generate_text(
@@ -32,25 +79,43 @@ async def _generate_text(
     temperature: float,
     max_output_tokens: int,
     thinking_budget: int,
+    timeout: float | None = None,
+    retries: int = 0,
 ) -> str:
-    try:
-        coro = _client().aio.models.generate_content(
-            model=settings.gemini_model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=temperature,
-                max_output_tokens=max_output_tokens,
-                thinking_config=types.ThinkingConfig(thinking_budget=thinking_budget),
-            ),
-        )
-        response = await asyncio.wait_for(coro, timeout=settings.llm_request_timeout_sec)
-    except LLMNotConfiguredError:
-        raise
-    except asyncio.TimeoutError as exc:
-        raise LLMRequestError("LLM 응답 시간이 초과되었습니다.") from exc
-    except Exception as exc:  # pragma: no cover - provider/network runtime errors
-        raise LLMRequestError("LLM 요청 중 오류가 발생했습니다.") from exc
+    from google.genai import types
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.llm_request_timeout_sec
+    attempt_timeout = min(timeout or settings.llm_request_timeout_sec, settings.llm_request_timeout_sec)
+    config = types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        thinking_config=types.ThinkingConfig(thinking_budget=thinking_budget),
+    )
+
+    for attempt in range(retries + 1):
+        try:
+            async with _llm_semaphore():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                coro = _client().aio.models.generate_content(
+                    model=settings.gemini_model,
+                    contents=prompt,
+                    config=config,
+                )
+                response = await asyncio.wait_for(coro, timeout=min(attempt_timeout, remaining))
+            break
+        except LLMNotConfiguredError:
+            raise
+        except asyncio.TimeoutError as exc:
+            backoff = LLM_RETRY_BACKOFF_SEC * 2**attempt
+            if attempt == retries or loop.time() + backoff >= deadline:
+                raise LLMRequestError("LLM 응답 시간이 초과되었습니다.") from exc
+            await asyncio.sleep(backoff)
+        except Exception as exc:  # pragma: no cover - provider/network runtime errors
+            raise LLMRequestError("LLM 요청 중 오류가 발생했습니다.") from exc
 
     text = (response.text or "").strip()
     if not text:
@@ -59,7 +124,33 @@ async def _generate_text(
     return text
 
 
+def _get_cached_comfort(key: tuple[str, str]) -> str | None:
+    cached = _comfort_cache.get(key)
+    if cached is None:
+        return None
+
+    stored_at, text = cached
+    if monotonic() - stored_at > COMFORT_CACHE_TTL_SEC:
+        del _comfort_cache[key]
+        return None
+
+    _comfort_cache.move_to_end(key)
+    return text
+
+
+def _store_cached_comfort(key: tuple[str, str], text: str) -> None:
+    _comfort_cache[key] = (monotonic(), text)
+    _comfort_cache.move_to_end(key)
+    while len(_comfort_cache) > COMFORT_CACHE_MAXSIZE:
+        _comfort_cache.popitem(last=False)
+
+
 async def generate_comfort_line(*, emotion_label: str, content: str) -> str:
+    cache_key = (emotion_label, content)
+    cached = _get_cached_comfort(cache_key)
+    if cached is not None:
+        return cached
+
     system_instruction = (
         "당신은 한국어 공감 메시지를 짧게 전하는 도우미입니다. "
         "해결책/조언/훈계/진단을 하지 말고 감정을 먼저 알아주세요. "
@@ -77,12 +168,23 @@ async def generate_comfort_line(*, emotion_label: str, content: str) -> str:
         "- 결과는 순수 문장만 반환"
     )
 
-    return await _generate_text(
+    text = await _generate_text(
         system_instruction=system_instruction,
         prompt=prompt,
         temperature=0.6,
         max_output_tokens=160,
         thinking_budget=0,
+        timeout=COMFORT_TIMEOUT_SEC,
+        retries=COMFORT_RETRIES,
+    )
+    _store_cached_comfort(cache_key, text)
+    return text
+
+
+async def generate_comfort_batch(items: Sequence[tuple[str, str]]) -> list[str]:
+    """Generate comfort lines for (emotion_label, content) pairs, bounded by LLM_MAX_CONCURRENCY."""
+    return await asyncio.gather(
+        *(generate_comfort_line(emotion_label=emotion_label, content=content) for emotion_label, content in items)
     )
 
 
@@ -110,4 +212,6 @@ async def generate_period_comment(*, period_days: int, emotion_counts: dict[str,
         temperature=0.4,
         max_output_tokens=220,
         thinking_budget=0,
+        timeout=INSIGHT_TIMEOUT_SEC,
+        retries=INSIGHT_RETRIES,
     )
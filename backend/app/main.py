@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from collections import Counter
 import json
 import logging
-from time import perf_counter
+from time import monotonic_ns
+from typing import Any, TypeVar
 from uuid import uuid4
 
-from fastapi import FastAPI
+import msgspec
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from app.config import settings
 from app.constants import Emotion, EMOTION_KO_LABEL
 from app.llm_client import LLMNotConfiguredError, LLMRequestError, generate_comfort_line, generate_period_comment
@@ -16,14 +22,24 @@ from app.pii_guard import mask_pii
 from app.schemas import ComfortRequest, ComfortResponse, InsightRequest, InsightResponse
 from app.services.guardrail import apply_comfort_guardrail, apply_insight_guardrail, is_crisis_text
 from app.services.messages import (
-    default_emotion_counter,
+    count_emotions,
     fallback_comfort_message,
     fallback_insight_comment,
     stub_comfort_message,
     stub_insight_comment,
 )
 
-LOCAL_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
+RequestT = TypeVar("RequestT", bound=msgspec.Struct)
+
+# Routes decode bodies with msgspec, so FastAPI cannot see the request models; describe them for OpenAPI here.
+(_COMFORT_REQUEST_SCHEMA, _INSIGHT_REQUEST_SCHEMA), _REQUEST_SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    [ComfortRequest, InsightRequest],
+    ref_template="#/components/schemas/{name}",
+)
+
+_EMOTION_KO_LABEL_BY_VALUE: dict[str, str] = {emotion.value: label for emotion, label in EMOTION_KO_LABEL.items()}
+
+LOCAL_ORIGIN_REGEX = r"^https?://(?:localhost|127\.0\.0\.1|\[::1\])(?::\d+)?$"
 
 app = FastAPI(title="Haeuso API", version="0.2.0")
 logger = logging.getLogger("haeuso.api")
@@ -31,12 +47,6 @@ logger.setLevel(logging.INFO)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-        "http://localhost:5174",
-        "http://127.0.0.1:5174",
-    ],
     allow_origin_regex=LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
@@ -45,8 +55,36 @@ app.add_middleware(
 
 
 def log_event(event: str, **fields: object) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     payload = {"event": event, **fields}
-    logger.info(json.dumps(payload, ensure_ascii=False))
+    if orjson is None:
+        logger.info(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+    else:
+        logger.info(orjson.dumps(payload).decode("utf-8"))
+
+
+async def decode_request(request: Request, request_type: type[RequestT]) -> RequestT:
+    try:
+        # strict=False keeps Pydantic-style lax coercion, e.g. "30" or 30.0 for an int field.
+        return msgspec.json.decode(await request.body(), type=request_type, strict=False)
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _json_request_body(schema: dict[str, Any]) -> dict[str, Any]:
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
+def _openapi_with_request_schemas() -> dict[str, Any]:
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_REQUEST_SCHEMA_COMPONENTS)
+    return app.openapi_schema
+
+
+app.openapi = _openapi_with_request_schemas
 
 
 @app.get("/health")
@@ -54,10 +92,15 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/api/v1/comfort", response_model=ComfortResponse)
-async def comfort(payload: ComfortRequest) -> ComfortResponse:
+@app.post(
+    "/api/v1/comfort",
+    response_model=ComfortResponse,
+    openapi_extra=_json_request_body(_COMFORT_REQUEST_SCHEMA),
+)
+async def comfort(request: Request) -> ComfortResponse:
+    payload = await decode_request(request, ComfortRequest)
     request_id = uuid4().hex
-    started_at = perf_counter()
+    started_at = monotonic_ns()
     pii_result = mask_pii(payload.content)
 
     if is_crisis_text(payload.content):
@@ -71,7 +114,7 @@ async def comfort(payload: ComfortRequest) -> ComfortResponse:
             pii_replacements=pii_result.replacements,
             fallback_used=False,
             guardrail_triggered=False,
-            duration_ms=int((perf_counter() - started_at) * 1000),
+            duration_ms=(monotonic_ns() - started_at) // 1_000_000,
         )
         return ComfortResponse(
             category="crisis",
@@ -87,7 +130,7 @@ async def comfort(payload: ComfortRequest) -> ComfortResponse:
         )
 
     emotion = payload.emotion or Emotion.calm
-    emotion_label = EMOTION_KO_LABEL[emotion]
+    emotion_label = _EMOTION_KO_LABEL_BY_VALUE[emotion.value]
     fallback_used = False
     guardrail_triggered = False
 
@@ -115,27 +158,29 @@ async def comfort(payload: ComfortRequest) -> ComfortResponse:
         llm_input_masked=pii_result.masked_text != payload.content,
         fallback_used=fallback_used,
         guardrail_triggered=guardrail_triggered,
-        duration_ms=int((perf_counter() - started_at) * 1000),
+        duration_ms=(monotonic_ns() - started_at) // 1_000_000,
     )
 
     return ComfortResponse(category="normal", message=message, resources=[])
 
 
-@app.post("/api/v1/insight", response_model=InsightResponse)
-async def insight(payload: InsightRequest) -> InsightResponse:
+@app.post(
+    "/api/v1/insight",
+    response_model=InsightResponse,
+    openapi_extra=_json_request_body(_INSIGHT_REQUEST_SCHEMA),
+)
+async def insight(request: Request) -> InsightResponse:
+    payload = await decode_request(request, InsightRequest)
     request_id = uuid4().hex
-    started_at = perf_counter()
+    started_at = monotonic_ns()
     period_days = 7 if payload.periodDays not in {7, 30} else payload.periodDays
-    counts = default_emotion_counter()
-
-    for entry in payload.entries:
-        counts[entry.emotion.value] += 1
+    counts = count_emotions(entry.emotion for entry in payload.entries)
 
     total = sum(counts.values())
     if total == 0:
         dominant = "none"
     else:
-        dominant = Counter(counts).most_common(1)[0][0]
+        dominant = max(counts, key=counts.__getitem__)
 
     fallback_used = False
     guardrail_triggered = False
@@ -171,7 +216,7 @@ async def insight(payload: InsightRequest) -> InsightResponse:
         dominant_emotion=dominant,
         fallback_used=fallback_used,
         guardrail_triggered=guardrail_triggered,
-        duration_ms=int((perf_counter() - started_at) * 1000),
+        duration_ms=(monotonic_ns() - started_at) // 1_000_000,
     )
 
     return InsightResponse(
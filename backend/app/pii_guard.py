@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Final
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PIIMaskResult:
     masked_text: str
     detected_types: list[str]
@@ -21,23 +21,31 @@ PII_PATTERNS: Final[list[tuple[str, str, re.Pattern[str]]]] = [
 ]
 
 
+_PII_REPLACEMENTS: Final[dict[str, str]] = {pii_type: replacement for pii_type, replacement, _ in PII_PATTERNS}
+_PII_PRIORITY: Final[dict[str, int]] = {pii_type: index for index, (pii_type, _, _) in enumerate(PII_PATTERNS)}
+_PII_COMBINED: Final[re.Pattern[str]] = re.compile(
+    "|".join(f"(?P<{pii_type}>{pattern.pattern})" for pii_type, _, pattern in PII_PATTERNS)
+)
+
+# Every PII pattern needs a digit or "@", so text without either can skip the full scan.
+_PII_CANDIDATE: Final[re.Pattern[str]] = re.compile(r"[\d@]")
+
+
 def mask_pii(text: str) -> PIIMaskResult:
-    masked = text
-    detected_types: list[str] = []
-    replacements = 0
+    if not _PII_CANDIDATE.search(text):
+        return PIIMaskResult(masked_text=text, detected_types=[], replacements=0)
+
+    detected: set[str] = set()
 
-    for pii_type, replacement, pattern in PII_PATTERNS:
-        def _repl(_: re.Match[str]) -> str:
-            nonlocal replacements
-            replacements += 1
-            if pii_type not in detected_types:
-                detected_types.append(pii_type)
-            return replacement
+    def _dispatch(match: re.Match[str]) -> str:
+        pii_type = match.lastgroup or ""
+        detected.add(pii_type)
+        return _PII_REPLACEMENTS[pii_type]
 
-        masked = pattern.sub(_repl, masked)
+    masked, replacements = _PII_COMBINED.subn(_dispatch, text)
 
     return PIIMaskResult(
         masked_text=masked,
-        detected_types=detected_types,
+        detected_types=sorted(detected, key=_PII_PRIORITY.__getitem__),
         replacements=replacements,
     )
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel
 
 from app.constants import Emotion
 
 
-class ComfortRequest(BaseModel):
-    content: str = Field(min_length=1, max_length=1000)
+class ComfortRequest(msgspec.Struct):
+    content: Annotated[str, msgspec.Meta(min_length=1, max_length=1000)]
     emotion: Emotion | None = None
 
 
@@ -18,13 +20,13 @@ class ComfortResponse(BaseModel):
     resources: list[str]
 
 
-class JournalEntryIn(BaseModel):
+class JournalEntryIn(msgspec.Struct):
     date: date
     emotion: Emotion
 
 
-class InsightRequest(BaseModel):
-    periodDays: int = Field(default=7)
+class InsightRequest(msgspec.Struct, kw_only=True):
+    periodDays: int = 7
     entries: list[JournalEntryIn]
 
 
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
-from app.constants import CRISIS_KEYWORDS, MEDICAL_RISK_PATTERNS, Emotion
+try:
+    import re2 as _regex
+except ImportError:  # pragma: no cover - optional dependency
+    import re as _regex
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+from app.constants import CRISIS_KEYWORDS, MEDICAL_RISK_PATTERN, Emotion
 from app.services.messages import fallback_comfort_message, fallback_insight_comment
 
+_MEDICAL_RISK_RE = _regex.compile(MEDICAL_RISK_PATTERN)
+
+
+def _build_crisis_automaton() -> ahocorasick.Automaton | None:
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in CRISIS_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_CRISIS_AUTOMATON = _build_crisis_automaton()
+
 
 def is_crisis_text(text: str) -> bool:
-    lowered = text.lower()
-    return any(keyword in lowered for keyword in CRISIS_KEYWORDS)
+    if _CRISIS_AUTOMATON is None:
+        return any(keyword in text for keyword in CRISIS_KEYWORDS)
+
+    return next(_CRISIS_AUTOMATON.iter(text), None) is not None
 
 
 def has_medical_risk(text: str) -> bool:
-    lowered = text.lower()
-    return any(pattern.search(lowered) for pattern in MEDICAL_RISK_PATTERNS)
+    return _MEDICAL_RISK_RE.search(text) is not None
 
 
 def apply_comfort_guardrail(message: str, *, text: str, emotion: Emotion) -> tuple[str, bool]:
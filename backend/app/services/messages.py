@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from app.constants import Emotion, FALLBACK_COMFORT, STUB_COMFORT
 
+_FALLBACK_COMFORT_BY_VALUE: dict[str, list[str]] = {emotion.value: lines for emotion, lines in FALLBACK_COMFORT.items()}
+_STUB_COMFORT_BY_VALUE: dict[str, str] = {emotion.value: line for emotion, line in STUB_COMFORT.items()}
+
+
+@lru_cache(maxsize=16)
+def _fallback_comfort_line(emotion_value: str, index: int) -> str:
+    return f"{_FALLBACK_COMFORT_BY_VALUE[emotion_value][index]} 지금 여기까지 오신 것만으로도 충분히 잘하고 계십니다."
+
 
 def fallback_comfort_message(text: str, emotion: Emotion | None) -> str:
-    target_emotion = emotion or Emotion.calm
-    lines = FALLBACK_COMFORT[target_emotion]
-    index = len(text.strip()) % len(lines)
-    return f"{lines[index]} 지금 여기까지 오신 것만으로도 충분히 잘하고 계십니다."
+    emotion_value = (emotion or Emotion.calm).value
+    index = len(text.strip()) % len(_FALLBACK_COMFORT_BY_VALUE[emotion_value])
+    return _fallback_comfort_line(emotion_value, index)
 
 
 def fallback_insight_comment(period_days: int, dominant: str, total: int) -> str:
@@ -27,7 +37,7 @@ def fallback_insight_comment(period_days: int, dominant: str, total: int) -> str
 
 
 def stub_comfort_message(emotion: Emotion) -> str:
-    return STUB_COMFORT[emotion]
+    return _STUB_COMFORT_BY_VALUE[emotion.value]
 
 
 def stub_insight_comment(period_days: int, dominant: str, total: int) -> str:
@@ -40,5 +50,12 @@ def stub_insight_comment(period_days: int, dominant: str, total: int) -> str:
     return f"테스트 모드 응답입니다. 최근 {period_days}일의 대표 감정은 {dominant}입니다."
 
 
-def default_emotion_counter() -> dict[str, int]:
-    return {emotion.value: 0 for emotion in Emotion}
+_EMOTION_INDEX: dict[Emotion, int] = {emotion: index for index, emotion in enumerate(Emotion)}
+_EMOTION_VALUES: list[str] = [emotion.value for emotion in Emotion]
+
+
+def count_emotions(emotions: Iterable[Emotion]) -> dict[str, int]:
+    totals = [0] * len(_EMOTION_VALUES)
+    for emotion in emotions:
+        totals[_EMOTION_INDEX[emotion]] += 1
+    return dict(zip(_EMOTION_VALUES, totals))
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from app import llm_client
+from app.config import Settings
+
+
+def _live_settings(**overrides: object) -> Settings:
+    fields: dict[str, object] = {
+        "gemini_api_key": "dummy",
+        "gemini_model": "gemini-3.5-flash",
+        "llm_request_timeout_sec": 30,
+        "llm_mode": "live",
+    }
+    fields.update(overrides)
+    return Settings(**fields)
+
+
+def test_generate_text_retries_timed_out_attempt(monkeypatch) -> None:
+    calls: list[int] = []
+
+    async def generate_content(**kwargs):  # noqa: ANN003
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return SimpleNamespace(text=" 두 번째 시도 응답 ")
+
+    fake_client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    monkeypatch.setattr(llm_client, "settings", _live_settings())
+    monkeypatch.setattr(llm_client, "_client", lambda: fake_client)
+    monkeypatch.setattr(llm_client, "LLM_RETRY_BACKOFF_SEC", 0)
+
+    text = asyncio.run(
+        llm_client._generate_text(
+            system_instruction="system",
+            prompt="prompt",
+            temperature=0.6,
+            max_output_tokens=160,
+            thinking_budget=0,
+            timeout=0.05,
+            retries=1,
+        )
+    )
+
+    assert text == "두 번째 시도 응답"
+    assert len(calls) == 2
+
+
+def test_generate_text_stops_retrying_at_request_timeout(monkeypatch) -> None:
+    calls: list[int] = []
+
+    async def generate_content(**kwargs):  # noqa: ANN003
+        calls.append(1)
+        await asyncio.sleep(10)
+
+    fake_client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    monkeypatch.setattr(llm_client, "settings", _live_settings(llm_request_timeout_sec=1))
+    monkeypatch.setattr(llm_client, "_client", lambda: fake_client)
+    monkeypatch.setattr(llm_client, "LLM_RETRY_BACKOFF_SEC", 0.05)
+
+    started_at = time.monotonic()
+    with pytest.raises(llm_client.LLMRequestError):
+        asyncio.run(
+            llm_client._generate_text(
+                system_instruction="system",
+                prompt="prompt",
+                temperature=0.6,
+                max_output_tokens=160,
+                thinking_budget=0,
+                timeout=0.4,
+                retries=5,
+            )
+        )
+
+    assert time.monotonic() - started_at < 1.3
+    assert len(calls) < 6
+
+
+def test_generate_comfort_line_reuses_cached_reply(monkeypatch) -> None:
+    calls: list[str] = []
+
+    async def fake_generate_text(**kwargs) -> str:  # noqa: ANN003
+        calls.append(kwargs["prompt"])
+        return "마음이 많이 무거우셨겠어요. 여기 잠시 내려놓으셔도 됩니다."
+
+    monkeypatch.setattr(llm_client, "_generate_text", fake_generate_text)
+    monkeypatch.setattr(llm_client, "_comfort_cache", OrderedDict())
+
+    first = asyncio.run(llm_client.generate_comfort_line(emotion_label="슬픔", content="오늘 너무 힘들어요"))
+    second = asyncio.run(llm_client.generate_comfort_line(emotion_label="슬픔", content="오늘 너무 힘들어요"))
+    asyncio.run(llm_client.generate_comfort_line(emotion_label="불안", content="오늘 너무 힘들어요"))
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_generate_comfort_batch_respects_concurrency_limit(monkeypatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def generate_content(*, contents: str, **kwargs):  # noqa: ANN003
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(text=contents.splitlines()[2])
+
+    fake_client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    monkeypatch.setattr(llm_client, "settings", _live_settings(llm_max_concurrency=2))
+    monkeypatch.setattr(llm_client, "_client", lambda: fake_client)
+
+    items = [("슬픔", f"기록 {index}") for index in range(6)]
+    # Two separate event loops must each get a working semaphore.
+    for _ in range(2):
+        monkeypatch.setattr(llm_client, "_comfort_cache", OrderedDict())
+        results = asyncio.run(llm_client.generate_comfort_batch(items))
+
+        assert results == [f"내용: 기록 {index}" for index in range(6)]
+
+    assert peak == 2
@@ -1,8 +1,14 @@
+import re
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app import main
 from app.config import Settings
 from app.pii_guard import mask_pii
+from app.constants import MEDICAL_RISK_PATTERN
+from app.services import guardrail
+from app.services.guardrail import has_medical_risk, is_crisis_text
 
 
 def _live_settings() -> Settings:
@@ -38,6 +44,71 @@ def test_mask_pii_handles_korean_suffix_after_phone() -> None:
     assert "010-1234-5555" not in result.masked_text
 
 
+def test_mask_pii_reports_types_in_pattern_priority_order() -> None:
+    result = mask_pii("주민 900101-1234567, 폰 010-1234-5678")
+
+    assert result.detected_types == ["phone", "rrn"]
+
+
+def test_mask_pii_returns_plain_text_unchanged() -> None:
+    text = "오늘은 그냥 조용히 쉬고 싶은 하루였어요."
+    result = mask_pii(text)
+
+    assert result.masked_text == text
+    assert result.detected_types == []
+    assert result.replacements == 0
+
+
+def test_mask_pii_masks_mixed_types_in_single_pass() -> None:
+    text = "카드 1234-5678-9012-3456, 사업자 123-45-67890, 메일 a@b.co, 카드 1111 2222 3333 4444"
+    result = mask_pii(text)
+
+    assert result.masked_text == "카드 [카드번호], 사업자 [사업자번호], 메일 [이메일], 카드 [카드번호]"
+    assert result.detected_types == ["email", "business_no", "card_no"]
+    assert result.replacements == 4
+
+
+def test_mask_pii_email_requires_dotted_domain() -> None:
+    result = mask_pii("메일은 first.last+tag@mail.example.co.kr, 서버는 admin@localhost 입니다.")
+
+    assert result.masked_text == "메일은 [이메일], 서버는 admin@localhost 입니다."
+    assert result.replacements == 1
+
+
+@pytest.mark.parametrize("address", ["a" * 70 + "@example.com", "x.y" + "a" * 70 + "@example.com"])
+def test_mask_pii_masks_oversized_email_local_part(address: str) -> None:
+    result = mask_pii(f"메일 {address} 입니다.")
+
+    assert result.masked_text == "메일 [이메일] 입니다."
+    assert result.detected_types == ["email"]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False], ids=["ahocorasick", "substring"])
+def test_is_crisis_text_detects_keywords(monkeypatch, use_automaton: bool) -> None:
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+        assert guardrail._CRISIS_AUTOMATON is not None
+    else:
+        monkeypatch.setattr(guardrail, "_CRISIS_AUTOMATON", None)
+
+    assert is_crisis_text("요즘은 그냥 사라지고 싶다는 생각이 들어요.")
+    assert is_crisis_text("자해")
+    assert not is_crisis_text("오늘은 조금 지쳤어요.")
+
+
+@pytest.mark.parametrize("text", ["약\u3000복용하세요", "약\xa0드시고", "치료\u2009를 받으세요"])
+def test_has_medical_risk_matches_unicode_spaces(text: str) -> None:
+    assert has_medical_risk(text)
+
+
+@pytest.mark.parametrize("text", ["약\u3000복용하세요", "약\xa0드시고", "치료\u2009를", "약 먹", "오늘은 괜찮아요"])
+def test_medical_risk_pattern_agrees_between_re_and_re2(text: str) -> None:
+    re2 = pytest.importorskip("re2")
+
+    expected = re.search(MEDICAL_RISK_PATTERN, text) is not None
+    assert (re2.search(MEDICAL_RISK_PATTERN, text) is not None) is expected
+
+
 def test_comfort_masks_pii_before_llm(monkeypatch) -> None:
     captured: dict[str, str] = {}
 
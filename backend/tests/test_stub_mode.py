@@ -1,3 +1,6 @@
+import logging
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app import main
@@ -56,3 +59,73 @@ def test_insight_uses_stub_response_without_llm(monkeypatch) -> None:
     body = response.json()
     assert body["dominantEmotion"] == "angry"
     assert body["comment"].startswith("테스트 모드 응답입니다.")
+
+
+def test_comfort_rejects_invalid_payload(monkeypatch) -> None:
+    monkeypatch.setattr(main, "settings", _stub_settings())
+
+    client = TestClient(main.app)
+    empty = client.post("/api/v1/comfort", json={"content": "", "emotion": "sad"})
+    unknown_emotion = client.post("/api/v1/comfort", json={"content": "오늘은 조금 지쳤어요.", "emotion": "bored"})
+
+    assert empty.status_code == 422
+    assert unknown_emotion.status_code == 422
+
+
+def test_insight_rejects_invalid_payload(monkeypatch) -> None:
+    monkeypatch.setattr(main, "settings", _stub_settings())
+
+    client = TestClient(main.app)
+    missing_entries = client.post("/api/v1/insight", json={"periodDays": 7})
+    unknown_emotion = client.post(
+        "/api/v1/insight",
+        json={"periodDays": 7, "entries": [{"date": "2026-02-20", "emotion": "bored"}]},
+    )
+    malformed = client.post("/api/v1/insight", content=b"{not json", headers={"Content-Type": "application/json"})
+
+    assert missing_entries.status_code == 422
+    assert unknown_emotion.status_code == 422
+    assert malformed.status_code == 422
+    assert isinstance(unknown_emotion.json()["detail"], str)
+
+
+def test_insight_coerces_numeric_strings(monkeypatch) -> None:
+    monkeypatch.setattr(main, "settings", _stub_settings())
+
+    client = TestClient(main.app)
+    response = client.post("/api/v1/insight", json={"periodDays": "30", "entries": []})
+
+    assert response.status_code == 200
+    assert response.json()["periodDays"] == 30
+
+
+def test_log_event_output_matches_with_and_without_orjson(monkeypatch, caplog) -> None:
+    pytest.importorskip("orjson")
+
+    def _emit() -> str:
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="haeuso.api"):
+            main.log_event("comfort_processed", category="정상", pii_types=["phone", "email"], fallback_used=False)
+        return caplog.records[-1].getMessage()
+
+    with_orjson = _emit()
+    monkeypatch.setattr(main, "orjson", None)
+    without_orjson = _emit()
+
+    assert with_orjson == without_orjson
+    assert with_orjson == '{"event":"comfort_processed","category":"정상","pii_types":["phone","email"],"fallback_used":false}'
+
+
+def test_openapi_describes_request_bodies() -> None:
+    schema = main.app.openapi()
+    components = schema["components"]["schemas"]
+
+    for path, model in (("/api/v1/comfort", "ComfortRequest"), ("/api/v1/insight", "InsightRequest")):
+        request_body = schema["paths"][path]["post"]["requestBody"]
+        assert request_body["required"] is True
+        assert request_body["content"]["application/json"]["schema"] == {"$ref": f"#/components/schemas/{model}"}
+        assert model in components
+
+    assert set(components["ComfortRequest"]["properties"]) == {"content", "emotion"}
+    assert set(components["InsightRequest"]["properties"]) == {"periodDays", "entries"}
+    assert {"JournalEntryIn", "Emotion", "ComfortResponse", "InsightResponse"} <= set(components)